@@ -2,20 +2,35 @@
 Scrape Yahoo Gemini report info and generate JSON schemas using guesswork.
 """
 
+import io
 import logging
 import json
 import os
+import re
 
 from pprint import pprint
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 LOGGER = logging.getLogger(__name__)
 
 PATH = "cubes.html"
 SCHEMA_DIR = 'schemas'
 METADATA_DIR = 'metadata'
 
+# Descriptions of numeric fields contain these words
+FLOAT_DESCRIPTION_KEYWORDS = ('cost', 'spend', 'rate')
+FLOAT_DESCRIPTION_PATTERN = re.compile('|'.join(FLOAT_DESCRIPTION_KEYWORDS))
+
+# Match each (non-nested) HTML table
+TABLE_PATTERN = re.compile(r'<table.*?</table>', flags=re.IGNORECASE | re.DOTALL)
+
 CUBES = [
     'performance_stats',
     'slot_performance_stats',
@@ -75,77 +90,83 @@ METADATA = [
     }]
 
 
-def guess_type(row: dict) -> str:
-    if row['Field'] == 'Day':
-        return 'date'
-
-    if 'CPC' in row['Field']:
-        return 'float'
-
-    if row['Field'].endswith('ID'):
-        return 'integer'
-
-    if row['Field'].endswith('Rate'):
-        return 'float'
-
-    if 'cost' in row['Description']:
-        return 'float'
-    if 'spend' in row['Description']:
-        return 'float'
-
-    if 'rate' in row['Description']:
-        return 'float'
-
-    if row['Type'][0].casefold() == 'd':
-        return 'string'
-
-    return 'integer'
+def guess_types(df) -> np.ndarray:
+    """Guess the data type of every field, using whole-column comparisons"""
+    field = df['Field']
+    description = df['Description']
+
+    # The first matching condition determines the type
+    conditions = [
+        field == 'Day',
+        field.str.contains('CPC', regex=False),
+        field.str.endswith('ID'),
+        field.str.endswith('Rate'),
+        description.str.contains(FLOAT_DESCRIPTION_PATTERN),
+        df['Type'].str[0].str.casefold() == 'd',
+    ]
+    choices = [
+        'date',
+        'float',
+        'integer',
+        'float',
+        'float',
+        'string',
+    ]
+
+    return np.select(conditions, choices, default='integer')
 
 
 def build_properties(df) -> dict:
     props = dict()
 
-    for _, row in df.iterrows():
+    for row, data_type in zip(df.itertuples(index=False), guess_types(df)):
         prop = dict(
-            type=guess_type(row),
-            description=row['Description'].strip()
+            type=str(data_type),
+            description=row.Description.strip()
         )
 
-        props[row['Field']] = prop
+        props[row.Field] = prop
 
     return props
 
 
 def serialise(path, obj):
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w') as file:
-        json.dump(obj, file, indent=2)
-        LOGGER.info('Wrote "%s"', file.name)
+
+    # Use the faster orjson encoder, if available
+    if orjson is None:
+        with open(path, 'w') as file:
+            json.dump(obj, file, indent=2)
+            LOGGER.info('Wrote "%s"', file.name)
+    else:
+        with open(path, 'wb') as file:
+            file.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            LOGGER.info('Wrote "%s"', file.name)
 
 
 def main():
     logging.basicConfig(level=logging.INFO)
 
     with open(PATH) as file:
-        data = pd.read_html(file)
+        html = file.read()
         LOGGER.info('Read "%s"', file.name)
 
+    # Parse each table separately, because reading many tables from one document is very slow
+    data = [pd.read_html(io.StringIO(table))[0] for table in TABLE_PATTERN.findall(html)]
+
     for name, df in zip(CUBES, data):
         df['Description'].fillna('', inplace=True)
 
-        schema = SCHEMA.copy()
-        schema['properties'] = build_properties(df)
+        schema = dict(SCHEMA, properties=build_properties(df))
 
         # Save schema file
         filename = "{}.json".format(name)
         path = os.path.join(SCHEMA_DIR, filename)
         serialise(path, schema)
 
-        # Save metadata file
-        metadata = METADATA.copy()
-        filename = "{}.json".format(name)
+        # Save metadata file (the same for every cube)
         path = os.path.join(METADATA_DIR, filename)
-        serialise(path, metadata)
+        serialise(path, METADATA)
 
 
 if __name__ == '__main__':
@@ -8,12 +8,16 @@ setup(
     author="Joe Heffer",
     url="https://github.com/singer-io/tap-gemini",
     classifiers=["Programming Language :: Python :: 3 :: Only"],
+    python_requires=">=3.9",
     py_modules=["tap_gemini"],
     install_requires=[
         "singer-python==5.4.1",
         "requests==2.21.0",
-        "pytz==2018.4",
     ],
+    extras_require={
+        # Faster JSON parsing and serialisation
+        "fast": ["orjson"],
+    },
     entry_points="""
     [console_scripts]
     tap-gemini=tap_gemini:main
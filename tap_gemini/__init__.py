@@ -12,11 +12,17 @@ Singer:
     - All timestamps must use the RFC3339 standard.
 """
 
+import concurrent.futures
 import datetime
 import json
 import os
+import sys
+import threading
 
-import pytz
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import singer
 import singer.metadata
@@ -43,6 +49,21 @@ OBJECT_MAP = dict(
     adsitesetting=tap_gemini.api.AdSiteSetting,
 )
 
+ONE_DAY = datetime.timedelta(days=1)
+
+# Location of the package's configuration files
+PACKAGE_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Serialise writes to standard output (and updates to the state) from concurrent streams
+OUTPUT_LOCK = threading.Lock()
+
+# Map JSON schema data types to Python types
+CASTERS = dict(
+    string=str,
+    integer=int,
+    number=float,
+)
+
 
 def cast_date_to_datetime(date: datetime.date = None) -> datetime.datetime:
     """
@@ -58,13 +79,23 @@ def cast_date_to_datetime(date: datetime.date = None) -> datetime.datetime:
     # Build timezone-aware datetime object
     return datetime.datetime.combine(
         date=date,
-        time=datetime.time(0, tzinfo=pytz.UTC)
+        time=datetime.time(0, tzinfo=datetime.timezone.utc)
     )
 
 
+def cast_to_date(value: datetime.date) -> datetime.date:
+    """Get the calendar date of a date or datetime object"""
+
+    # datetime.datetime is a subclass of datetime.date
+    if isinstance(value, datetime.datetime):
+        return value.date()
+
+    return value
+
+
 def get_abs_path(path: str) -> str:
     """Build the absolute path on the local filesystem"""
-    return os.path.join(os.path.dirname(os.path.realpath(__file__)), path)
+    return os.path.join(PACKAGE_DIR, path)
 
 
 def load_directory(dir_path: str) -> dict:
@@ -75,22 +106,34 @@ def load_directory(dir_path: str) -> dict:
     data = dict()
 
     # Iterate over JSON files
-    for filename in os.listdir(abs_path):
-        if not filename.endswith('json'):
-            continue
+    with os.scandir(abs_path) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json') or not entry.is_file():
+                continue
 
-        path = os.path.join(abs_path, filename)
-        name = filename.replace('.json', '').casefold().replace(' ', '_')
+            name = entry.name.replace('.json', '').casefold().replace(' ', '_')
+
+            data[name] = load_file(entry.path)
+
+    return data
 
-        # Parse JSON
-        with open(path) as file:
-            try:
-                data[name] = json.load(file)
-            except json.JSONDecodeError:
-                singer.log_error('JSON syntax error in file "%s"', file.name)
-                raise
 
-            singer.log_debug('Loaded "%s"', file.name)
+def load_file(path: str):
+    """Load a JSON configuration file"""
+
+    # Parse JSON (use the faster orjson parser, if available)
+    with open(path, 'rb') as file:
+        try:
+            if orjson is None:
+                data = json.load(file)
+            else:
+                data = orjson.loads(file.read())
+        # orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+        except json.JSONDecodeError:
+            singer.log_error('JSON syntax error in file "%s"', file.name)
+            raise
+
+        singer.log_debug('Loaded "%s"', file.name)
 
     return data
 
@@ -98,13 +141,11 @@ def load_directory(dir_path: str) -> dict:
 def load_schemas() -> dict:
     """Load schemas from config files"""
 
-    schemas = load_directory(tap_gemini.settings.SCHEMAS_DIR)
-
-    # Build singer.Schema objects from raw JSON data
-    for name, data in schemas.items():
-        schemas[name] = singer.Schema.from_dict(data=data)
-
-    return schemas
+    # Build (new) singer.Schema objects from raw JSON data
+    return {
+        name: singer.Schema.from_dict(data=data)
+        for name, data in load_directory(tap_gemini.settings.SCHEMAS_DIR).items()
+    }
 
 
 def load_metadata() -> dict:
@@ -119,7 +160,7 @@ def load_key_properties() -> dict:
     return load_directory(tap_gemini.settings.KEY_PROPERTIES_DIR)
 
 
-def generate_time_windows(start: datetime.date, size: int, end: datetime.date = None) -> iter:
+def generate_time_windows(start: datetime.date, size: int, end: datetime.date = None) -> list:
     """
     Generate a collection of time ranges of a certain size to overcome the window-size limits for
     some reports.
@@ -127,34 +168,30 @@ def generate_time_windows(start: datetime.date, size: int, end: datetime.date =
     Each time range is defined using a two-tuple that contains the start and end date of that time
     window.
 
-    :rtype: iter[tuple[datetime.date]]
+    :rtype: list[tuple[datetime.date]]
     """
 
     # Default end time range today
     if end is None:
-        end = cast_date_to_datetime(date=datetime.date.today())
+        end = datetime.date.today()
 
     # Enforce data types
-    start = datetime.date(start.year, start.month, start.day)
-    end = datetime.date(end.year, end.month, end.day)
+    start = cast_to_date(start)
+    end = cast_to_date(end)
 
     # Define time window size e.g. 15 days
     window = datetime.timedelta(days=size)
 
-    _start = start
-    while True:
-        _end = _start + window
-
-        # Maximum date
-        _end = min(_end, end)
-
-        yield (_start, _end)
+    # Each window starts on the day after the previous one ends
+    step = window + ONE_DAY
 
-        if _end >= end:
-            return
+    # Number of windows (at least one)
+    n_windows = max((end - start) // step + 1, 1)
 
-        # Move to the start of the next window
-        _start = _end + datetime.timedelta(days=1)
+    return [
+        (_start, min(_start + window, end))
+        for _start in (start + i * step for i in range(n_windows))
+    ]
 
 
 def discover() -> singer.Catalog:
@@ -195,39 +232,37 @@ def discover() -> singer.Catalog:
     return singer.Catalog(streams)
 
 
-def get_selected_streams(catalog: singer.Catalog) -> list:
+def get_selected_streams(catalog: singer.Catalog) -> set:
     """
     Gets selected streams.  Checks schema's 'selected' first (legacy)
     and then checks metadata (current), looking for an empty breadcrumb
     and data with a 'selected' entry
     """
-    selected_streams = list()
+    selected_streams = set()
 
     for stream in catalog.streams:
-        stream_metadata = singer.metadata.to_map(stream.metadata)
-        # stream metadata will have an empty breadcrumb
-        if singer.metadata.get(stream_metadata, (), "selected"):
-            selected_streams.append(stream.tap_stream_id)
+        for item in stream.metadata:
+            # stream metadata will have an empty breadcrumb
+            if not item.get('breadcrumb'):
+                if item.get('metadata', dict()).get('selected'):
+                    selected_streams.add(stream.tap_stream_id)
+                break
 
     return selected_streams
 
 
-def build_report_params(config: dict, stream, start_date: datetime.datetime,
-                        end_date: datetime.datetime = None) -> dict:
+def build_report_params(config: dict, stream) -> dict:
     """
     Convert a JSON schema to Gemini report parameters.
 
+    These parameters are the same for every time window of a stream.
+
     JSON schema: http://json-schema.org/
     """
 
-    if end_date is None:
-        end_date = cast_date_to_datetime(date=datetime.date.today())
-
     return dict(
         cube=str(stream.stream),
         field_names=list(stream.schema.properties.keys()),
-        start_date=datetime.date(start_date.year, start_date.month, start_date.day),
-        end_date=datetime.date(end_date.year, end_date.month, end_date.day),
     )
 
 
@@ -236,39 +271,52 @@ def filter_schema(schema: dict, metadata: list) -> dict:
     Select fields using meta-data
     """
 
-    for item in metadata:
-        try:
-            if item['breadcrumb'][0] == 'properties':
-                property_name = item['breadcrumb'][1]
+    removed = set()
 
-                # Get metadata for this property
-                selected = item['metadata'].get('selected', True)
-                inclusion = item['metadata'].get('inclusion', 'available')
+    for breadcrumb, item in singer.metadata.to_map(metadata).items():
+        # Skip stream (and nested) metadata
+        if len(breadcrumb) != 2 or breadcrumb[0] != 'properties':
+            continue
 
-                # Some fields are mandatory
-                if inclusion == 'automatic':
-                    selected = True
+        # Get metadata for this property
+        selected = item.get('selected', True)
+        inclusion = item.get('inclusion', 'available')
 
-                # Remove if not selected
-                if not selected or (inclusion == 'unsupported'):
-                    del schema.properties[property_name]
+        # Some fields are mandatory
+        if inclusion == 'automatic':
+            selected = True
 
-                    singer.log_debug('Removed property "%s"', property_name)
+        # Remove if not selected
+        if not selected or (inclusion == 'unsupported'):
+            removed.add(breadcrumb[1])
 
-        except IndexError:
-            pass
+    # Remove all the properties in a single pass
+    if removed:
+        schema.properties = {
+            property_name: prop
+            for property_name, prop in schema.properties.items()
+            if property_name not in removed
+        }
+
+        singer.log_debug('Removed properties %s', sorted(removed))
 
     return schema
 
 
-def get_books_closed(rep: tap_gemini.report.GeminiReport) -> datetime.datetime:
+def get_books_closed(rep: tap_gemini.report.GeminiReport,
+                     today: datetime.datetime = None) -> datetime.datetime:
     """
     Get the time when the books are closed i.e. the data become static and will no longer change.
 
     Only set the bookmark to the date when the books are closed, rather than naively using the
     report end date.
+
+    :param today: Midnight (UTC) of the current day, defaults to now
     """
 
+    if today is None:
+        today = cast_date_to_datetime()
+
     # Default to start date: if books are closed then re-run the report in the future
     # from this same beginning date.
     bookmark_timestamp = cast_date_to_datetime(rep.start_date)
@@ -278,74 +326,73 @@ def get_books_closed(rep: tap_gemini.report.GeminiReport) -> datetime.datetime:
     check_date = cast_date_to_datetime(rep.end_date)
 
     # Don't bother starting today, go back to yesterday
-    if check_date == cast_date_to_datetime(date=datetime.date.today()):
-        check_date -= datetime.timedelta(days=1)
+    if check_date == today:
+        check_date -= ONE_DAY
 
-    # Find when books are closed, iterating back through time
-    while True:
+    # Usually the books are closed right up to the end of the time range, so check that first
+    if check_date >= bookmark_timestamp:
         books_closed_timestamp = rep.are_books_closed(date=check_date)
 
-        # Successfully found when books closed
         if books_closed_timestamp is not None:
-            bookmark_timestamp = books_closed_timestamp
-            break
+            return books_closed_timestamp
+
+        check_date -= ONE_DAY
+
+    # Books are closed in chronological order, so find the most recent closed date by bisecting
+    # the time range (one request per step, rather than one per day)
+    earliest_date = cast_date_to_datetime(rep.start_date)
+    while earliest_date <= check_date:
+        mid_date = earliest_date + ((check_date - earliest_date).days // 2) * ONE_DAY
+
+        books_closed_timestamp = rep.are_books_closed(date=mid_date)
 
-        # Go back through time by one day
-        check_date -= datetime.timedelta(days=1)
+        # Books are closed, so look for a later date
+        if books_closed_timestamp is not None:
+            bookmark_timestamp = books_closed_timestamp
+            earliest_date = mid_date + ONE_DAY
 
-        # Stop looping
-        if check_date < bookmark_timestamp:
-            break
+        # Books are open, so look for an earlier date
+        else:
+            check_date = mid_date - ONE_DAY
 
     return bookmark_timestamp
 
 
-def transform_property(value, data_type: str, string_format: str = None):
-    """Cast data types, as instructed by the schema"""
+def cast_date_time(value) -> datetime.datetime:
+    """Parse a timestamp, which is serialised as an RFC3339 string by to_json()"""
 
-    # Missing values are null
-    if value is None:
-        return
+    # API objects already have timezone-aware timestamps, so don't format and re-parse them
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.astimezone(datetime.timezone.utc)
 
-    # Cast data type according to schema
-    if data_type == 'string':
-        value = str(value)
+    return singer.utils.strptime_to_utc(str(value))
 
-        # Parse dates
-        if string_format == 'date-time':
-            value = singer.utils.strptime_to_utc(value).isoformat()
 
-    elif data_type == 'integer':
-        value = int(value)
+def get_caster(data_type: str, string_format: str = None):
+    """Choose the function that casts values to the data type instructed by the schema"""
 
-    elif data_type == 'number':
-        value = float(value)
+    # Parse dates
+    if data_type == 'string' and string_format == 'date-time':
+        return cast_date_time
 
-    else:
+    try:
+        return CASTERS[data_type]
+    except KeyError:
         raise ValueError('Unknown data type', data_type)
 
-    return value
-
 
-def transform_record(record: dict, schema: dict) -> dict:
+def build_transform_plan(schema: dict) -> list:
     """
-    Cast the data types of each field (property) of a record according to the schema definition,
-    ready for output using JSON schema.
+    Interpret the schema definition once per stream, so that records may be transformed without
+    looking up each property definition for every row.
 
-    :param record: Input record
     :param schema: Schema definition of data types.
-    :return: Record with data types safe for output to JSON schema
+    :returns: List of two-tuples containing the property name and its caster function
     """
 
-    # Build a new dictionary, rather than mutating the input dictionary
-    transformed_record = dict()
-
-    # Iterate over properties in the record
-    for key, value in record.items():
-
-        # Get the property definition from the schema
-        prop = schema['properties'][key]
+    plan = list()
 
+    for key, prop in schema['properties'].items():
         data_type = prop['type']
 
         # If multiple data types are defined, pick one at random
@@ -358,41 +405,121 @@ def transform_record(record: dict, schema: dict) -> dict:
 
             data_type = data_types.pop()
 
+        plan.append((key, get_caster(data_type=data_type, string_format=prop.get('format'))))
+
+    return plan
+
+
+def transform_record(record: dict, plan: list, transformed_record: dict = None) -> dict:
+    """
+    Cast the data types of each field (property) of a record according to the schema definition,
+    ready for output using JSON schema.
+
+    :param record: Input record
+    :param plan: Property casters, see build_transform_plan()
+    :param transformed_record: Output dictionary to overwrite, which may be re-used for each record
+        to avoid building a new dictionary every time
+    :return: Record with data types safe for output to JSON schema
+    """
+
+    # Build a new dictionary, rather than mutating the input dictionary
+    if transformed_record is None:
+        transformed_record = dict()
+
+    # Iterate over properties defined in the schema
+    for key, caster in plan:
         try:
-            value = transform_property(
-                value=value,
-                data_type=data_type,
-                string_format=prop.get('format')
-            )
+            value = record[key]
+        except KeyError:
+            # Clear any value left over from a previous record
+            transformed_record.pop(key, None)
+            continue
 
-        # Show which property has caused the problem
-        except ValueError:
-            LOGGER.error('Property "%s" could not be cast to data type "%s"', key, prop['type'])
-            raise
+        # Missing values are null
+        if value is not None:
+            try:
+                value = caster(value)
+
+            # Show which property has caused the problem
+            except ValueError:
+                LOGGER.error('Property "%s" could not be cast using %s', key, caster.__name__)
+                raise
 
         transformed_record[key] = value
 
     return transformed_record
 
 
-def write_records(stream: singer.catalog.CatalogEntry, rows: iter, tags=None):
+def to_json(obj) -> bytes:
+    """Serialise an object as JSON, formatting timestamps using RFC3339"""
+
+    if orjson is None:
+        return json.dumps(obj, default=datetime.datetime.isoformat).encode()
+
+    return orjson.dumps(obj)
+
+
+def write_output(buffer: bytes):
+    """Write serialised messages to standard output in a single call"""
+
+    with OUTPUT_LOCK:
+        # Preserve the order of any messages emitted via the singer text stream
+        sys.stdout.flush()
+
+        sys.stdout.buffer.write(buffer)
+        sys.stdout.buffer.flush()
+
+
+def write_records(stream: singer.catalog.CatalogEntry, rows: iter, tags=None,
+                  plan: list = None):
     """
     Wrapper for singer utils
+
+    Record messages are buffered and written to standard output in batches, rather than making
+    one write per record.
+
+    :param plan: Transform plan, if already built (defaults to a plan for the stream's schema)
     """
 
-    schema = stream.schema.to_dict()
+    if plan is None:
+        plan = build_transform_plan(stream.schema.to_dict())
     # metadata = singer.metadata.to_map(stream.metadata)
-    time_extracted = singer.utils.now()
+    time_extracted = singer.utils.strftime(singer.utils.now())
+
+    # Pre-serialise the parts of the record message (equivalent to singer.RecordMessage) that are
+    # the same for every record
+    message_prefix = b'{"type":"RECORD","stream":' + to_json(stream.tap_stream_id) + b',"record":'
+    message_suffix = b',"time_extracted":' + to_json(time_extracted) + b'}\n'
+
+    buffer = bytearray()
+
+    # Each record is serialised immediately, so the same dictionary is re-used
+    record = dict()
+
+    def flush(n_records: int):
+        """Emit buffered records"""
+        try:
+            write_output(buffer)
+
+        # Log problems that may occur in the tap after the records are emitted
+        except (OSError, BrokenPipeError):
+            LOGGER.error('Failed to write %s records (%s bytes) for stream "%s"', n_records,
+                         len(buffer), stream.tap_stream_id)
+            raise
+
+        buffer.clear()
 
     # Iterate over rows of data
     with singer.metrics.Timer(metric='job_timer', tags=tags):
         with singer.metrics.Counter(metric='record_count', tags=tags) as counter:
-            for row in rows:
+            n_buffered = 0
 
-                # Check type
-                if not isinstance(row, dict):
-                    raise TypeError('ROW: Type {} is not dict'.format(type(row)))
+            # Bind names used in the loop to local variables for faster look-ups
+            buffer_size = tap_gemini.settings.OUTPUT_BUFFER_SIZE
+            transform = transform_record
+            serialise = to_json
 
+            for row in rows:
                 # Disabled because this seems to return a string, rather than a dictionary
                 # Transform data row for JSON output
                 # record = singer.transform(
@@ -401,175 +528,264 @@ def write_records(stream: singer.catalog.CatalogEntry, rows: iter, tags=None):
                 #     metadata=metadata
                 # )
 
-                record = transform_record(row, schema=schema)
-
-                # Check type
-                if not isinstance(record, dict):
-                    raise TypeError('RECORD: Type {} is not dict'.format(type(record)))
+                transform(row, plan, record)
 
-                # Emit record
-                try:
-
-                    singer.write_record(
-                        stream_name=stream.tap_stream_id,
-                        record=record,
-                        time_extracted=time_extracted
-                    )
+                # Build record message
+                buffer += message_prefix
+                buffer += serialise(record)
+                buffer += message_suffix
+                n_buffered += 1
 
-                # Log problems that may occur in the tap after the record is emitted
-                except (OSError, BrokenPipeError):
-                    LOGGER.error('Tap record parsing error for stream "%s"', stream.tap_stream_id)
-                    LOGGER.error('Problematic record: "%s"', json.dumps(record))
-                    raise
+                # Emit records
+                if len(buffer) >= buffer_size:
+                    flush(n_buffered)
+                    counter.increment(n_buffered)
+                    n_buffered = 0
 
-                counter.increment()
+            # Emit remaining records
+            if buffer:
+                flush(n_buffered)
+                counter.increment(n_buffered)
 
 
-def sync(config: dict, state: dict, catalog: singer.Catalog):
+def sync_stream(config: dict, state: dict, stream: singer.catalog.CatalogEntry,
+                session: tap_gemini.transport.GeminiSession, advertiser_ids: list,
+                start_date: datetime.datetime, today: datetime.datetime = None):
     """
-    Synchronise data from source schemas using input context
+    Synchronise data for a single stream
+
+    :param today: Midnight (UTC) of the current day, defaults to now
     """
-    
-    session = None
 
-    # Get bookmarks of state of each stream
-    bookmarks = state.get('bookmarks', dict())
+    if today is None:
+        today = cast_date_to_datetime()
 
-    # Parse timestamp and convert to date
-    start_date = singer.utils.strptime_to_utc(config['start_date'])
+    stream_id = stream.tap_stream_id
 
-    selected_stream_ids = get_selected_streams(catalog)
+    # Get the bookmark of the state of this stream
+    bookmark = state.get('bookmarks', dict()).get(stream_id, dict())
 
-    if not selected_stream_ids:
-        singer.log_warning('No streams selected')
+    LOGGER.info('Syncing stream: "%s"', stream_id)
 
-    # Iterate over streams in catalog
-    for stream in catalog.streams:
+    filter_schema(stream.schema, stream.metadata)
 
-        stream_id = stream.tap_stream_id
-
-        # Skip if not selected for sync
-        if stream_id not in selected_stream_ids:
-            continue
-
-        LOGGER.info('Syncing stream: "%s"', stream_id)
-
-        filter_schema(stream.schema, stream.metadata)
+    # Serialise the schema and derive the transform plan once per stream
+    schema = stream.schema.to_dict()
+    plan = build_transform_plan(schema)
 
-        # Emit schema
+    # Emit schema
+    with OUTPUT_LOCK:
         singer.write_schema(
             stream_name=stream_id,
-            schema=stream.schema.to_dict(),
+            schema=schema,
             key_properties=stream.key_properties
         )
 
-        # Initialise Gemini HTTP API session (only do this once)
-        if session is None:
-            session = tap_gemini.transport.GeminiSession(
-                # Mandatory
-                client_id=config['username'],
-                client_secret=config['password'],
-                refresh_token=config['refresh_token'],
-
-                # Optional
-                api_version=config.get('api_version'),
-                user_agent=config.get('user_agent'),
-                session_options=config.get('session', dict()),
-                sandbox=config.get('sandbox')
-            )
-            
-            # Get a list of all the account IDs
-            advertiser_ids = config.get('advertiser_ids', [adv['id'] for adv in session.advertisers])
-
-        # Create data stream
-        if stream_id in OBJECT_MAP.keys():
-
-            # List API objects
-            model = OBJECT_MAP[stream_id]
-            write_records(
-                stream=stream,
-                rows=model.list_data(session=session),
-                tags=dict(
-                    object=stream_id
-                )
+    # Create data stream
+    model = OBJECT_MAP.get(stream_id)
+    if model is not None:
+
+        # Skip objects that were listed recently, if configured
+        synced_at = bookmark.get(tap_gemini.settings.SYNCED_AT_KEY)
+        ttl_hours = config.get('object_ttl_hours')
+        if synced_at is not None and ttl_hours is not None:
+            age = singer.utils.now() - singer.utils.strptime_to_utc(synced_at)
+
+            if age < datetime.timedelta(hours=float(ttl_hours)):
+                LOGGER.info('"%s" is up to date (synced at %s)', stream_id, synced_at)
+                return
+
+        LOGGER.info('"%s" full refresh', stream_id)
+
+        synced_at = singer.utils.now().isoformat()
+
+        # List API objects
+        write_records(
+            stream=stream,
+            rows=model.list_data(session=session),
+            tags=dict(
+                object=stream_id
+            ),
+            plan=plan
+        )
+
+        # Preserve state for each stream
+        with OUTPUT_LOCK:
+            singer.write_bookmark(
+                state=state,
+                tap_stream_id=stream_id,
+                key=tap_gemini.settings.SYNCED_AT_KEY,
+                val=synced_at
             )
 
-        else:
-            # Run report
+            singer.write_state(state)
 
-            # Use bookmark to continue where we left off
-            bookmark = bookmarks.get(stream_id, dict())
-            start_date = bookmark.get(tap_gemini.settings.BOOKMARK_KEY, start_date)
+    else:
+        # Run report
 
-            # Define time range
-            try:
-                # Is there a maximum look back? (i.e. earliest start date for report)
-                days = tap_gemini.settings.MAX_LOOK_BACK_DAYS[stream_id]
+        # Use bookmark to continue where we left off
+        if tap_gemini.settings.BOOKMARK_KEY in bookmark:
+            # Bookmarks are stored as RFC3339 strings
+            start_date = singer.utils.strptime_to_utc(bookmark[tap_gemini.settings.BOOKMARK_KEY])
+            LOGGER.info('"%s" incremental update from %s', stream_id, start_date)
+        else:
+            LOGGER.info('"%s" full refresh from %s', stream_id, start_date)
 
-                # Get the current timestamp and "look back" the specified number of days
-                look_back_start_date = singer.utils.now() - datetime.timedelta(days=days)
+        # Define time range
+        try:
+            # Is there a maximum look back? (i.e. earliest start date for report)
+            days = tap_gemini.settings.MAX_LOOK_BACK_DAYS[stream_id]
 
-                # Must we confine the time range to avoid errors?
-                if look_back_start_date > start_date:
-                    start_date = look_back_start_date
-                    singer.log_warning(
-                        "\"%s\" enforced maximum look back of %s days, start date set to %s",
-                        stream_id, days, start_date)
+            # Get the current timestamp and "look back" the specified number of days
+            look_back_start_date = singer.utils.now() - datetime.timedelta(days=days)
 
-            except KeyError:
-                pass
+            # Must we confine the time range to avoid errors?
+            if look_back_start_date > start_date:
+                start_date = look_back_start_date
+                singer.log_warning(
+                    "\"%s\" enforced maximum look back of %s days, start date set to %s",
+                    stream_id, days, start_date)
 
-            # Break into time window chunks, if necessary
-            try:
-                time_windows = generate_time_windows(
-                    start=start_date,
-                    size=tap_gemini.settings.MAX_WINDOW_DAYS[stream_id]
-                )
-            except KeyError:
-                # Default time window: just use specified start/end date
-                time_windows = (
-                    (start_date, cast_date_to_datetime(date=datetime.date.today())),
-                )
+        except KeyError:
+            pass
 
-            # Each report is run within a single time window
-            for start, end in time_windows:
-                # Build report definition
-                report_params = build_report_params(
-                    config=config,
-                    stream=stream,
-                    start_date=start,
-                    end_date=end
-                )
+        # Break into time window chunks, if necessary
+        try:
+            time_windows = generate_time_windows(
+                start=start_date,
+                size=tap_gemini.settings.MAX_WINDOW_DAYS[stream_id],
+                end=today
+            )
+        except KeyError:
+            # Default time window: just use specified start/end date
+            time_windows = (
+                (start_date, today),
+            )
 
-                report_params['advertiser_ids'] = advertiser_ids
+        # Build report definition
+        report_params = build_report_params(config=config, stream=stream)
+        report_params['advertiser_ids'] = advertiser_ids
+
+        # Each report is run within a single time window
+        reports = [
+            tap_gemini.report.GeminiReport(
+                session=session,
+                start_date=cast_to_date(start),
+                end_date=cast_to_date(end),
+                poll_interval=config.get('poll_interval'),
+                **report_params
+            )
+            for start, end in time_windows
+        ]
 
-                # Define the report
-                rep = tap_gemini.report.GeminiReport(
-                    session=session,
-                    poll_interval=config.get('poll_interval'),
-                    **report_params
-                )
+        # Submit and poll the reports concurrently, while records are emitted in time order
+        report_max_workers = int(config.get('report_max_workers',
+                                            tap_gemini.settings.REPORT_MAX_WORKERS))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=report_max_workers)
+        try:
+            polls = [executor.submit(rep.poll) for rep in reports]
+
+            for rep, poll in zip(reports, polls):
+                # Wait for the report to be ready for download
+                poll.result()
 
                 # Emit records
                 write_records(
                     stream=stream,
                     rows=rep.stream(),
-                    tags=rep.tags
+                    tags=rep.tags,
+                    plan=plan
                 )
 
                 # Bookmark the progress through the stream
                 # Get the time when the data is complete (no further changes will occur)
-                bookmark_timestamp = get_books_closed(rep=rep)
+                bookmark_timestamp = get_books_closed(rep=rep, today=today)
 
                 # Preserve state for each stream
-                singer.write_bookmark(
+                with OUTPUT_LOCK:
+                    singer.write_bookmark(
+                        state=state,
+                        tap_stream_id=stream_id,
+                        key=tap_gemini.settings.BOOKMARK_KEY,
+                        val=cast_date_to_datetime(bookmark_timestamp).isoformat()
+                    )
+
+                    singer.write_state(state)
+
+        except BaseException:
+            # Don't wait for (or submit) report jobs that will never be downloaded
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        executor.shutdown()
+
+
+def sync(config: dict, state: dict, catalog: singer.Catalog):
+    """
+    Synchronise data from source schemas using input context
+
+    The selected streams are independent of each other, so they are synchronised concurrently.
+    """
+
+    # Parse timestamp and convert to date
+    start_date = singer.utils.strptime_to_utc(config['start_date'])
+
+    selected_stream_ids = get_selected_streams(catalog)
+
+    if not selected_stream_ids:
+        singer.log_warning('No streams selected')
+        return
+
+    max_workers = int(config.get('max_workers', tap_gemini.settings.MAX_WORKERS))
+    report_max_workers = int(config.get('report_max_workers',
+                                        tap_gemini.settings.REPORT_MAX_WORKERS))
+
+    # Initialise Gemini HTTP API session, shared by all streams (its connections are closed when
+    # the sync is finished)
+    with tap_gemini.transport.GeminiSession(
+        # Mandatory
+        client_id=config['username'],
+        client_secret=config['password'],
+        refresh_token=config['refresh_token'],
+
+        # Optional
+        api_version=config.get('api_version'),
+        user_agent=config.get('user_agent'),
+        session_options=config.get('session', dict()),
+        sandbox=config.get('sandbox'),
+        # Each concurrent stream may poll several reports at once
+        pool_maxsize=max_workers * report_max_workers
+    ) as session:
+
+        # Get a list of all the account IDs (only call the API if they aren't configured)
+        advertiser_ids = config.get('advertiser_ids')
+        if not advertiser_ids:
+            advertiser_ids = [adv['id'] for adv in session.advertisers]
+
+        # Midnight (UTC) of the current day, the end of the report time range
+        today = cast_date_to_datetime()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    sync_stream,
+                    config=config,
                     state=state,
-                    tap_stream_id=stream_id,
-                    key=tap_gemini.settings.BOOKMARK_KEY,
-                    val=cast_date_to_datetime(bookmark_timestamp).isoformat()
+                    stream=stream,
+                    session=session,
+                    advertiser_ids=advertiser_ids,
+                    start_date=start_date,
+                    today=today
                 )
+                # Iterate over streams in catalog
+                for stream in catalog.streams
+                # Skip if not selected for sync
+                if stream.tap_stream_id in selected_stream_ids
+            ]
 
-                singer.write_state(state)
+            # Raise any errors that occurred while syncing
+            for future in futures:
+                future.result()
 
 
 @singer.utils.handle_top_exception(LOGGER)
@@ -584,7 +800,11 @@ def main():
     # If discover flag was passed, run discovery mode and dump output to stdout
     if args.discover:
         catalog = discover()
-        print(json.dumps(catalog.to_dict(), indent=2))
+
+        if orjson is None:
+            print(json.dumps(catalog.to_dict(), indent=2))
+        else:
+            write_output(orjson.dumps(catalog.to_dict(), option=orjson.OPT_INDENT_2) + b'\n')
 
     # Otherwise run in sync mode
     else:
@@ -8,8 +8,7 @@ Account structure objects: https://developer.yahoo.com/nativeandsearch/guide/obj
 """
 
 import datetime
-
-import pytz
+import typing
 
 
 class Object:
@@ -68,9 +67,8 @@ class Object:
         return objects
 
     @classmethod
-    def list_data(cls, session=None) -> list:
-        """List all objects of this type"""
-        objects = list()
+    def list_data(cls, session=None) -> typing.Iterator[dict]:
+        """Iterate over the data of all objects of this type"""
 
         if session is None:
             session = cls.session
@@ -80,12 +78,10 @@ class Object:
             # The Native & Search API exposes lastUpdateDate and createdDate as read-only fields in
             # API responses for all Native & Search API objects. These fields provide UNIX
             # timestamps for when an object was created and last updated.
-            for key in {'lastUpdateDate', 'createdDate'}:
-                obj[key] = datetime.datetime.fromtimestamp(obj[key] / 1000, tz=pytz.UTC)
+            for key in ('lastUpdateDate', 'createdDate'):
+                obj[key] = datetime.datetime.fromtimestamp(obj[key] / 1000, tz=datetime.timezone.utc)
 
-            objects.append(obj)
-
-        return objects
+            yield obj
 
     def to_dict(self) -> dict:
         """Build a dictionary containing this object's data"""
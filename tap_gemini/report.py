@@ -7,10 +7,11 @@ https://developer.yahoo.com/nativeandsearch/guide/reporting/
 
 import csv
 import datetime
+import functools
 import logging
+import random
 import time
-
-import pytz
+import zoneinfo
 
 import tap_gemini.exceptions
 
@@ -20,6 +21,19 @@ REPORT_ENDPOINT = 'reports'
 CUSTOM_REPORT_ENDPOINT = REPORT_ENDPOINT + '/custom'
 DEFAULT_POLL_INTERVAL = 1.0
 
+# Poll time delay growth factor and limit (seconds)
+POLL_BACKOFF = 2.0
+MAX_POLL_INTERVAL = 60.0
+
+# Number of times to retry a request that exceeded the API's rate limit
+MAX_RATE_LIMIT_RETRIES = 8
+
+# Status of a job that is running or in a queue waiting to commence
+PENDING_STATUSES = frozenset(('running', 'submitted'))
+
+# Number of bytes to read from the report download at a time
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class BooksClosedNotImplementedError(NotImplementedError):
     """Books Closed is not supported for this cube."""
@@ -47,10 +61,10 @@ class GeminiReport:
         self.job_id = None
         self.download_url = None
 
-    @property
+    @functools.cached_property
     def definition(self) -> dict:
         """
-        Build report definition
+        Build report definition (once per report)
 
         https://developer.yahoo.com/nativeandsearch/guide/reporting/
         """
@@ -82,6 +96,31 @@ class GeminiReport:
             filters=_filters
         )
 
+    def call(self, **kwargs):
+        """
+        Make an API call, waiting and retrying (with back-off) if too many requests have been made
+        """
+
+        n_attempts = 0
+        delay = max(1.0, self.poll_interval)
+
+        while True:
+            n_attempts += 1
+
+            try:
+                return self.session.call(**kwargs)
+
+            except tap_gemini.exceptions.TooManyRequestsError:
+                if n_attempts > MAX_RATE_LIMIT_RETRIES:
+                    raise
+
+                secs = max(1.0, min(MAX_POLL_INTERVAL, delay * random.uniform(0.8, 1.2)))
+                delay = min(MAX_POLL_INTERVAL, delay * POLL_BACKOFF)
+
+                LOGGER.warning('Too many requests for "%s", retrying in %.1f seconds', self.cube,
+                               secs)
+                time.sleep(secs)
+
     def submit(self) -> str:
         """
         Submit a report request and retrieve a job ID number for polling
@@ -89,7 +128,7 @@ class GeminiReport:
         :returns: Job ID
         """
 
-        data = self.session.call(
+        data = self.call(
             method='POST',
             endpoint=CUSTOM_REPORT_ENDPOINT,
             json=self.definition
@@ -123,20 +162,24 @@ class GeminiReport:
                 job_id = self.submit()
 
         endpoint = "{}/{}".format(CUSTOM_REPORT_ENDPOINT, job_id)
+        params = {'advertiserId': self.advertiser_id}
 
         # Repeatedly poll the reporting server until the data is ready to download
         n_attempts = 0
         status = 'submitted'
+        delay = max(1.0, self.poll_interval)
 
         while True:
             n_attempts += 1
 
-            # Time delay (minimum one second) with exponential back-off
-            secs = (max(1.0, self.poll_interval) + 0.2) ** n_attempts
+            # Time delay (minimum one second) with capped exponential back-off, and some jitter so
+            # that concurrent jobs don't poll in lockstep (the jitter is applied before the limits)
+            secs = max(1.0, min(MAX_POLL_INTERVAL, delay * random.uniform(0.8, 1.2)))
+            delay = min(MAX_POLL_INTERVAL, delay * POLL_BACKOFF)
 
-            response = self.session.call(
+            response = self.call(
                 endpoint=endpoint,
-                params={'advertiserId': self.advertiser_id},
+                params=params,
                 tags=dict(
                     poll_attempt=n_attempts,
                     poll_time_seconds=time.time() - start_time,
@@ -153,7 +196,7 @@ class GeminiReport:
                 break
 
             # The job is running or in a queue waiting to commence
-            elif status in {'running', 'submitted'}:
+            elif status in PENDING_STATUSES:
                 # Short time delay before polling again, exponential decay
                 time.sleep(secs)
 
@@ -178,7 +221,7 @@ class GeminiReport:
 
         # Stream report data CSV, line by line
         response = self.session.get(self.download_url, stream=True)
-        data = response.iter_lines(decode_unicode=True)
+        data = response.iter_lines(chunk_size=DOWNLOAD_CHUNK_SIZE, decode_unicode=True)
 
         # Parse CSV format
 
@@ -186,8 +229,28 @@ class GeminiReport:
         reader = csv.reader(data)
         headers = next(reader)  # list
 
-        # Yield data rows (dictionaries) from the CSV stream
-        yield from csv.DictReader(data, fieldnames=headers)
+        n_headers = len(headers)
+        n_mismatched = 0
+
+        # Yield data rows (dictionaries) from the CSV stream, pairing the values with the headers
+        # directly rather than going through csv.DictReader
+        for row in reader:
+            # Skip blank lines
+            if not row:
+                continue
+
+            if len(row) != n_headers:
+                n_mismatched += 1
+
+                # Missing values are null, as with csv.DictReader (extra values are dropped)
+                row = row[:n_headers] + [None] * (n_headers - len(row))
+
+            yield dict(zip(headers, row))
+
+        # Warn once per report rather than for every row
+        if n_mismatched:
+            LOGGER.warning('%s report rows did not have %s values (one per header)', n_mismatched,
+                           n_headers)
 
     @property
     def advertiser_id(self) -> int:
@@ -234,7 +297,7 @@ class GeminiReport:
             if cube is not None:
                 params['cubeName'] = cube
 
-            return self.session.call(
+            return self.call(
                 endpoint=endpoint,
                 params=params
             )
@@ -255,7 +318,8 @@ class GeminiReport:
         """
         Check whether books are closed for the specified date.
 
-        :returns: Timezone-aware timestamp for the time when the books were closed.
+        :returns: Timezone-aware timestamp for the time when the books were closed, or None if
+            the books are still open.
         """
 
         status = self.close_of_business(date)
@@ -271,8 +335,11 @@ class GeminiReport:
 
         LOGGER.debug('CLOSE_OF_BUSINESS: %s %s (%s%%)', date, books_closed, books_closed_ratio)
 
+        if not books_closed:
+            return None
+
         # Build timestamp
         return datetime.datetime.combine(
             date=date,
-            time=datetime.time(0, tzinfo=pytz.timezone(status['advertiserTimezone']))
+            time=datetime.time(0, tzinfo=zoneinfo.ZoneInfo(status['advertiserTimezone']))
         )
@@ -32,3 +32,16 @@ MAX_LOOK_BACK_DAYS = dict(
 )
 
 BOOKMARK_KEY = 'start_date'
+
+# Bookmark of when API objects were last listed
+SYNCED_AT_KEY = 'synced_at'
+
+# Number of streams to synchronise concurrently
+MAX_WORKERS = 4
+
+# Number of report jobs to run at the same time for each stream (keep this small to stay within
+# the API's rate limits)
+REPORT_MAX_WORKERS = 2
+
+# Number of bytes of record messages to buffer before writing to standard output
+OUTPUT_BUFFER_SIZE = 256 * 1024
@@ -8,9 +8,15 @@ https://developer.yahoo.com/nativeandsearch/guide/
 import datetime
 import http
 import logging
-import urllib.parse
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import requests
+import requests.adapters
 import singer
 
 import tap_gemini.exceptions
@@ -25,39 +31,25 @@ AUTHENTICATION_URL = "https://api.login.yahoo.com/oauth2/get_token"
 # https://developer.yahoo.com/nativeandsearch/guide/navigate-the-api/versioning/
 DEFAULT_API_VERSION = 3
 
-# Map HTTP error codes to specific exceptions
+# HTTP headers that are obfuscated when logged (lower case)
+SENSITIVE_HEADERS = frozenset(('authorization', 'proxy-authorization', 'cookie', 'set-cookie'))
+
+# Refresh access tokens this long before they expire
+TOKEN_EXPIRY_MARGIN = datetime.timedelta(minutes=1)
+
+# Map HTTP status codes and API error codes to specific exceptions
 ERROR_MAP = {
-    500: {
-        'E10000_INTERNAL_SERVER_ERROR': tap_gemini.exceptions.InternalServerError,
-        'E60000_UNKNOWN_REPORTING_ERROR': tap_gemini.exceptions.UnknownReportingError,
-    },
-    406: {
-        'E30001_UNSUPPORTED_FEATURE': tap_gemini.exceptions.UnsupportedFeatureError
-    },
-    400: {
-        'E40000_INVALID_INPUT': tap_gemini.exceptions.InvalidInputError
-    },
-    401: {
-        'E50000_AUTHORIZATION_ERROR': tap_gemini.exceptions.AuthorizationError
-    },
-    503: {
-        'E50003_SERVICE_UNAVAILABLE': tap_gemini.exceptions.ServiceUnavailableError
-    },
-    408: {
-        'E40001_REQUEST_TIMEOUT': tap_gemini.exceptions.RequestTimeoutError
-    },
-    405: {
-        'E40002_ACCOUNT_IN_SYNC_READ_ONLY': tap_gemini.exceptions.AccountInSyncReadOnlyError
-    },
-    403: {
-        'E40003_TOO_MANY_REQUESTS': tap_gemini.exceptions.TooManyRequestsError
-    },
-    409: {
-        'E40004_REQUEST_CONFLICT': tap_gemini.exceptions.RequestsConflictError
-    },
-    404: {
-        'E40005_NOT_FOUND': tap_gemini.exceptions.NotFoundError
-    },
+    (500, 'E10000_INTERNAL_SERVER_ERROR'): tap_gemini.exceptions.InternalServerError,
+    (500, 'E60000_UNKNOWN_REPORTING_ERROR'): tap_gemini.exceptions.UnknownReportingError,
+    (406, 'E30001_UNSUPPORTED_FEATURE'): tap_gemini.exceptions.UnsupportedFeatureError,
+    (400, 'E40000_INVALID_INPUT'): tap_gemini.exceptions.InvalidInputError,
+    (401, 'E50000_AUTHORIZATION_ERROR'): tap_gemini.exceptions.AuthorizationError,
+    (503, 'E50003_SERVICE_UNAVAILABLE'): tap_gemini.exceptions.ServiceUnavailableError,
+    (408, 'E40001_REQUEST_TIMEOUT'): tap_gemini.exceptions.RequestTimeoutError,
+    (405, 'E40002_ACCOUNT_IN_SYNC_READ_ONLY'): tap_gemini.exceptions.AccountInSyncReadOnlyError,
+    (403, 'E40003_TOO_MANY_REQUESTS'): tap_gemini.exceptions.TooManyRequestsError,
+    (409, 'E40004_REQUEST_CONFLICT'): tap_gemini.exceptions.RequestsConflictError,
+    (404, 'E40005_NOT_FOUND'): tap_gemini.exceptions.NotFoundError,
 }
 
 
@@ -66,11 +58,16 @@ class GeminiSession(requests.Session):
 
     def __init__(self, client_id: str, client_secret: str, refresh_token: str,
                  access_token: str = None, user_agent: str = None, sandbox: bool = False,
-                 api_version: int = None, session_options: dict = None):
+                 api_version: int = None, session_options: dict = None,
+                 pool_maxsize: int = None):
 
         # Initialise HTTP session
         super().__init__()
 
+        # Keep enough connections alive for concurrent requests to re-use them
+        if pool_maxsize is not None:
+            self.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize))
+
         # Configure advanced HTTP options
         session_options = session_options or dict()
         for key, value in session_options.items():
@@ -94,13 +91,13 @@ class GeminiSession(requests.Session):
         self.client_secret = client_secret
         self.refresh_token = refresh_token
         self.access_token = access_token
-
-        # Update HTTP headers
-        self.headers.update(self.headers_extra)
+        self._auth_lock = threading.Lock()
 
         # Overwrite user agent
+        # (The authorization header is only added before the first API request, so creating a
+        # session doesn't authenticate)
         if user_agent:
-            self.headers.update({'User-Agent': user_agent})
+            self.headers['User-Agent'] = user_agent
 
     @property
     def headers_extra(self) -> dict:
@@ -115,10 +112,11 @@ class GeminiSession(requests.Session):
         access_token = self._access_token
 
         # Get new token
-        if not access_token:
+        if not access_token or self.access_token_expired:
             auth_data = self.authenticate()
             access_token = auth_data['access_token']
             self.access_token = access_token
+            self._access_token_expires = singer.utils.now() + auth_data['expires_in']
 
         return access_token
 
@@ -126,11 +124,19 @@ class GeminiSession(requests.Session):
     def access_token(self) -> None:
         """OAuth 2.0 Access Token"""
         self._access_token = None
+        self._access_token_expires = None
 
     @access_token.setter
     def access_token(self, new_token: str) -> None:
-        """Access token setter"""
+        """Access token setter (the expiry time of a token set this way is unknown)"""
         self._access_token = new_token
+        self._access_token_expires = None
+
+    @property
+    def access_token_expired(self) -> bool:
+        """Whether the access token has expired, or is about to"""
+        expires = self._access_token_expires
+        return expires is not None and singer.utils.now() >= expires - TOKEN_EXPIRY_MARGIN
 
     def _request_authentication(self) -> requests.Response:
         """
@@ -202,28 +208,39 @@ class GeminiSession(requests.Session):
         return data
 
     def build_url(self, endpoint: str) -> str:
-        """Build the URI for the specified endpoint"""
-        return urllib.parse.urljoin(self.base_url, endpoint)
+        """Build the URI for the specified endpoint (relative to the API base URL)"""
+        return self.base_url + endpoint.lstrip('/')
 
     @staticmethod
     def log_response_headers(response: requests.Response):
         """Log HTTP headers"""
-        for header, value in response.request.headers.items():
+        for prefix, headers in (('REQUEST', response.request.headers),
+                                ('RESPONSE', response.headers)):
+            for header, value in headers.items():
 
-            # Obfuscate sensitive info
-            if header == 'Authorization':
-                value = '************************'
+                # Obfuscate sensitive info
+                if header.casefold() in SENSITIVE_HEADERS:
+                    value = '************************'
 
-            LOGGER.debug("REQUEST %s: %s", header, value)
-        for header, value in response.headers.items():
-            LOGGER.debug("RESPONSE %s: %s", header, value)
+                LOGGER.debug("%s %s: %s", prefix, header, value)
 
     def request(self, method: str, url: str, *args, **kwargs) -> requests.Response:
         """Wrapper for requests methods, implement error handling"""
 
+        # Authenticate on first use, or again if the access token has expired or was rejected by
+        # a previous request (authentication requests themselves don't use the token)
+        if url not in {AUTHENTICATION_URL, AUTHORIZATION_URL}:
+            with self._auth_lock:
+                if ('Authorization' not in self.headers or not self._access_token
+                        or self.access_token_expired):
+                    self.headers.update(self.headers_extra)
+
         # Make HTTP request
         response = super().request(method, url, *args, **kwargs)
-        self.log_response_headers(response)
+
+        # Only iterate over the headers if they'll actually be logged
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            self.log_response_headers(response)
 
         try:
             response.raise_for_status()
@@ -231,12 +248,20 @@ class GeminiSession(requests.Session):
         # Handle HTTP errors
         except requests.HTTPError as http_error:
 
-            # Clear authentication info
+            # Clear authentication info (unless another thread has already replaced the token
+            # that was rejected)
             if response.status_code == http.HTTPStatus.UNAUTHORIZED:
-                del self.access_token
+                with self._auth_lock:
+                    if response.request.headers.get('Authorization') == \
+                            self.headers.get('Authorization'):
+                        del self.access_token
 
-            # De-serialise JSON response
-            data = response.json()
+            # De-serialise JSON response (error pages from proxies etc. may not be JSON)
+            try:
+                data = response.json()
+            except ValueError:
+                LOGGER.error(response.text)
+                raise tap_gemini.exceptions.GeminiHTTPError(response.text) from http_error
 
             # Get one or more errors returned from the API
             errors = list()
@@ -246,7 +271,7 @@ class GeminiSession(requests.Session):
                 errors.extend(data['errors'])
             # If a single error occurs then append it to the list
             except KeyError:
-                errors.append(data['error'])
+                errors.append(data.get('error', data))
 
             # Log all errors
             for error in errors:
@@ -254,10 +279,16 @@ class GeminiSession(requests.Session):
 
             # Raise an appropriate specific exception for the first error encountered
             for error in errors:
-                gemini_error = ERROR_MAP[response.status_code][error['code']]
+                # Single errors may just be a string e.g. OAuth {"error": "invalid_grant"}
+                code = error.get('code') if isinstance(error, dict) else None
+                gemini_error = ERROR_MAP.get((response.status_code, code),
+                                             tap_gemini.exceptions.GeminiHTTPError)
 
                 raise gemini_error(error) from http_error
 
+            # No error details were given
+            raise tap_gemini.exceptions.GeminiHTTPError(data) from http_error
+
         return response
 
     def call(self, method: str = 'GET', endpoint: str = '', tags: dict = None, **kwargs):
@@ -270,7 +301,8 @@ class GeminiSession(requests.Session):
         if tags is None:
             tags = dict()
 
-        url = kwargs.get('url', self.build_url(endpoint=endpoint))
+        # An explicit URL overrides the endpoint (pop it, so it isn't passed to request() twice)
+        url = kwargs.pop('url', None) or self.build_url(endpoint=endpoint)
 
         # Singer HTTP response timer
         tags = dict(  # meta-data
@@ -286,19 +318,21 @@ class GeminiSession(requests.Session):
             # Retrieve HTTP response
             response = self.request(method=method, url=url, **kwargs)
 
-        data = response.json()
-
-        api_response = data.pop('response')
+        # De-serialise JSON response (use the faster orjson parser, if available)
+        if orjson is None:
+            data = response.json()
+        else:
+            data = orjson.loads(response.content)
 
         # Raise exceptions
-        errors = data.pop('errors')
+        errors = data.get('errors')
 
         if errors:
             for error in errors:
                 LOGGER.error(error)
             raise RuntimeError(errors)
 
-        return api_response
+        return data['response']
 
     @property
     def advertisers(self) -> list: